@@ -6,7 +6,7 @@ Ziele und aktueller stabiler Stand:
 - NEUE Geräte werden mit eindeutigem Default-Namen angelegt: "Lancom AP <MAC>".
 - Remote-Scanner (BaseHaRemoteScanner) pro AP, Bermuda-kompatibel (discovered_device_timestamps, time_since_last_detection).
 - Self-Advert nutzt einen Basisnamen OHNE MAC (z. B. "Lancom AP" oder der vom Benutzer gesetzte Name); der Monitor hängt "(MAC)" idealerweise selbst an.
-- Self-Advert wird bei jedem Aufruf wirklich gesendet (kein Early-Return), und Refresh wird zuverlässig neu geplant.
+- Self-Advert wird gesendet, sobald sich der Basisname ändert oder der letzte Self-Advert älter als 30s ist; Refresh wird dann zuverlässig neu geplant.
 - Verwendet echte HA-Bluetooth Klassen (BLEDevice, BluetoothAdvertisementData) für Advert-Paare.
 - Services: add_ap, sync_registry, consolidate_devices, force_scanner_name, fix_all_names.
 
@@ -17,7 +17,7 @@ Neu in dieser Version:
 - device.name bleibt Default "Lancom AP <MAC>", solange kein Benutzername existiert.
 
 Zusätzlich:
-- Interne Paket-Counter pro AP (packets_today) und Rolling-Zeiten (packet_times).
+- Interne Paket-Counter pro AP (packets_today) und Rolling-Fenster (Sekunden-Ringpuffer über 1h).
 - Sensor-Plattform wird per async_forward_entry_setups geladen.
 """
 
@@ -25,17 +25,18 @@ from __future__ import annotations
 
 import logging
 import re
-from binascii import unhexlify
 from typing import Any, Dict, Iterable, Tuple, Callable
-from collections import deque
-from datetime import datetime, timezone
+from functools import lru_cache
+from datetime import datetime, time, timedelta, timezone
 
 from aiohttp.web_response import Response
 
 from homeassistant.core import HomeAssistant, callback, ServiceCall, Event
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_call_later
+from homeassistant.util.json import json_loads
 from homeassistant.helpers.device_registry import (
     EVENT_DEVICE_REGISTRY_UPDATED,
     EventDeviceRegistryUpdatedData,
@@ -82,26 +83,51 @@ _LOGGER = logging.getLogger(__name__)
 MAC_ANY_PATTERN = re.compile(
     r"([0-9A-Fa-f]{2}[:\-]){5}[0-9A-Fa-f]{2}|[0-9A-Fa-f]{12}"
 )
+# Vorkompilierte Hilfs-Regexe (Hot-Path im Webhook)
+_NON_HEX_RE = re.compile(r"[^0-9A-Fa-f]")
+_WS_RE = re.compile(r"\s{2,}")
+# Trennzeichen der AP-Liste -> Zeilenumbruch (ein Durchlauf statt mehrerer replace)
+_SEP_TRANS = str.maketrans({",": "\n", ";": "\n", " ": "\n"})
+# Gültiges advertisingData: nur Hex-Zeichen (gerade Länge wird separat geprüft)
+_HEX_RE = re.compile(r"\A[0-9A-Fa-f]*\Z")
+# Kanonische Form aus format_ble_mac: AA:BB:CC:DD:EE:FF
+_MAC_CANONICAL_RE = re.compile(r"\A[0-9A-F]{2}(?::[0-9A-F]{2}){5}\Z")
 
 
 # -------------------- Helfer -------------------- #
 
 
+@lru_cache(maxsize=4096)
 def format_ble_mac(raw: str) -> str:
-    """Normiere Eingabe zu AA:BB:CC:DD:EE:FF (uppercase), behalte Original bei ungültiger Länge."""
+    """Normiere Eingabe zu AA:BB:CC:DD:EE:FF (uppercase), behalte Original bei ungültiger Länge.
+
+    Gecacht: dieselben Roh-MACs kommen mit jedem Webhook wieder.
+    """
     if not raw:
         return raw
-    s = re.sub(r"[^0-9A-Fa-f]", "", raw)
+    s = _NON_HEX_RE.sub("", raw)
     if len(s) != 12:
         return raw.upper()
     return ":".join(s[i : i + 2] for i in range(0, 12, 2)).upper()
 
 
+@lru_cache(maxsize=512)
 def identifier_for(mac_upper: str) -> str:
-    """Stabiler Identifier für Device Registry."""
+    """Stabiler Identifier für Device Registry (gecacht, AP-MACs sind begrenzt)."""
     return f"lancom_ble_{mac_upper.lower().replace(':', '_')}"
 
 
+def _mac_from_identifier(value: str) -> str | None:
+    """Lese MAC_UPPER aus 'lancom_ble_aa_bb_cc_dd_ee_ff' (None bei anderem Format)."""
+    if len(value) != 28 or not value.startswith("lancom_ble_"):
+        return None
+    mac_upper = value[11:].replace("_", ":").upper()
+    # Sechs '_'-getrennte Hex-Paare erzwingen (sonst kein gültiger Identifier)
+    if not _MAC_CANONICAL_RE.match(mac_upper):
+        return None
+    return mac_upper
+
+
 def normalize_input_mac_list(raw: str | list[str] | None) -> list[str]:
     """Wandelt String/Liste in bereinigte eindeutige MAC-Liste um."""
     if raw is None:
@@ -110,17 +136,14 @@ def normalize_input_mac_list(raw: str | list[str] | None) -> list[str]:
     if isinstance(raw, list):
         items = raw
     else:
-        tmp = raw
-        for ch in [",", ";", "\n", " "]:
-            tmp = tmp.replace(ch, "\n")
-        items = tmp.split("\n")
+        items = raw.translate(_SEP_TRANS).split("\n")
     out: list[str] = []
     for item in items:
         item = item.strip()
         if not item:
             continue
         fm = format_ble_mac(item)
-        if fm.count(":") == 5 and len(fm) == 17:
+        if _MAC_CANONICAL_RE.match(fm):
             out.append(fm)
         else:
             _LOGGER.warning(
@@ -129,9 +152,13 @@ def normalize_input_mac_list(raw: str | list[str] | None) -> list[str]:
     return sorted(set(out))
 
 
-def mac_connection_only(mac_upper: str) -> set[tuple[str, str]]:
-    """Nur ('mac', lower) – wie Shelly. Vermeidet Mehrfach-Treffer."""
-    return {("mac", mac_upper.lower())}
+@lru_cache(maxsize=256)
+def mac_connection_only(mac_upper: str) -> frozenset[tuple[str, str]]:
+    """Nur ('mac', lower) – wie Shelly. Vermeidet Mehrfach-Treffer.
+
+    Gecacht und daher unveränderlich (frozenset); die Registry normalisiert Connections selbst.
+    """
+    return frozenset({("mac", mac_upper.lower())})
 
 
 def _safe_int(value, default: int | None = None) -> int | None:
@@ -146,16 +173,27 @@ def _safe_int(value, default: int | None = None) -> int | None:
         except Exception:
             return default
     if isinstance(value, str):
+        s = value.strip()
+        # Fast-Path für Ganzzahlen ohne Exception-Kosten
+        digits = s[1:] if s[:1] == "-" else s
+        if digits.isdecimal():
+            return int(s)
         try:
-            return int(value.strip())
+            return int(round(float(s)))
         except Exception:
-            try:
-                return int(round(float(value.strip())))
-            except Exception:
-                return default
+            return default
     return default
 
 
+def seconds_until_midnight_local() -> float:
+    """Sekunden bis zur nächsten lokalen Mitternacht (DST-sicher)."""
+    now_local = datetime.now(timezone.utc).astimezone()
+    midnight = datetime.combine(
+        now_local.date() + timedelta(days=1), time.min
+    ).astimezone()
+    return max(0.0, (midnight - now_local).total_seconds())
+
+
 def _strip_paren_mac(name: str, mac_upper: str) -> str:
     """Entferne ein trailing '(MAC)'."""
     suffix = f"({mac_upper})"
@@ -164,6 +202,15 @@ def _strip_paren_mac(name: str, mac_upper: str) -> str:
     return name
 
 
+@lru_cache(maxsize=512)
+def _clean_user_name_cached(name: str, mac_upper: str) -> str:
+    """Reine (gecachte) Bereinigung für _cleanup_user_name, ohne Logging."""
+    name = _strip_paren_mac(name, mac_upper)
+    name = MAC_ANY_PATTERN.sub("", name).strip()
+    name = _WS_RE.sub(" ", name)
+    return name or "Lancom AP"
+
+
 def _cleanup_user_name(name: str, mac_upper: str) -> str:
     """
     Bereinigt NUR Benutzer-Namen:
@@ -171,19 +218,19 @@ def _cleanup_user_name(name: str, mac_upper: str) -> str:
     - Entfernt isolierte MAC-Fragmente innerhalb des Namens
     - Lässt legitime Worte stehen
     Ziel: Schöner Basisname ohne doppelte MAC, aber Default "Lancom AP <MAC>" bleibt in device.name.
+    Die Bereinigung selbst ist gecacht: (name, MAC) ändert sich nur bei Umbenennung.
     """
-    original = name
-    name = _strip_paren_mac(name, mac_upper)
-    name = MAC_ANY_PATTERN.sub("", name).strip()
-    name = re.sub(r"\s{2,}", " ", name)
-    if not name:
-        name = "Lancom AP"
-    if name != original:
-        _LOGGER.debug("Benutzername bereinigt: '%s' -> '%s'", original, name)
-    return name
+    cleaned = _clean_user_name_cached(name, mac_upper)
+    if cleaned != name:
+        _LOGGER.debug("Benutzername bereinigt: '%s' -> '%s'", name, cleaned)
+    return cleaned
 
 
-def get_base_device_name(hass: HomeAssistant, mac_upper: str) -> str:
+def get_base_device_name(
+    hass: HomeAssistant,
+    mac_upper: str,
+    devreg: dr.DeviceRegistry | None = None,
+) -> str:
     """
     LOGIK Basisname:
     - Wenn user einen eigenen Namen gesetzt hat (name_by_user), verwenden wir dessen bereinigte Version ohne MAC.
@@ -192,7 +239,8 @@ def get_base_device_name(hass: HomeAssistant, mac_upper: str) -> str:
       * Device Registry bleibt eindeutig: "Lancom AP <MAC>"
       * Self-Advert: "Lancom AP" oder Benutzername ohne MAC
     """
-    devreg = dr.async_get(hass)
+    if devreg is None:
+        devreg = dr.async_get(hass)
     ident = identifier_for(mac_upper)
     device = devreg.async_get_device(identifiers={(DOMAIN, ident)})
     if not device:
@@ -203,12 +251,17 @@ def get_base_device_name(hass: HomeAssistant, mac_upper: str) -> str:
     return "Lancom AP"
 
 
-def ensure_device_registry_default_name(hass: HomeAssistant, mac_upper: str):
+def ensure_device_registry_default_name(
+    hass: HomeAssistant,
+    mac_upper: str,
+    devreg: dr.DeviceRegistry | None = None,
+):
     """
     Stellt sicher, dass NEUE Geräte mit Default "Lancom AP <MAC>" existieren.
     Ändert NICHT user-spezifische Namen.
     """
-    devreg = dr.async_get(hass)
+    if devreg is None:
+        devreg = dr.async_get(hass)
     ident = identifier_for(mac_upper)
     device = devreg.async_get_device(identifiers={(DOMAIN, ident)})
     if not device:
@@ -230,13 +283,18 @@ def ensure_device_registry_default_name(hass: HomeAssistant, mac_upper: str):
             )
 
 
-def maybe_align_device_name_with_user(hass: HomeAssistant, mac_upper: str) -> bool:
+def maybe_align_device_name_with_user(
+    hass: HomeAssistant,
+    mac_upper: str,
+    devreg: dr.DeviceRegistry | None = None,
+) -> bool:
     """
     Wenn der Benutzer einen Namen gesetzt hat (name_by_user), setze device.name auf den bereinigten Benutzer-Namen.
     Nur dann, wenn device.name aktuell generisch ist (Default 'Lancom AP <MAC>' oder beginnt mit 'Lancom AP').
     Rückgabe: True, wenn aktualisiert wurde.
     """
-    devreg = dr.async_get(hass)
+    if devreg is None:
+        devreg = dr.async_get(hass)
     ident = identifier_for(mac_upper)
     device = devreg.async_get_device(identifiers={(DOMAIN, ident)})
     if not device:
@@ -246,9 +304,8 @@ def maybe_align_device_name_with_user(hass: HomeAssistant, mac_upper: str) -> bo
         return False
     cleaned = _cleanup_user_name(user, mac_upper)
     current = device.name or ""
-    is_default_like = current == f"Lancom AP {mac_upper}" or current.startswith(
-        "Lancom AP"
-    )
+    # startswith deckt auch den exakten Default "Lancom AP <MAC>" ab
+    is_default_like = current.startswith("Lancom AP")
     if is_default_like and current != cleaned:
         try:
             devreg.async_update_device(device.id, name=cleaned)
@@ -269,15 +326,39 @@ def maybe_align_device_name_with_user(hass: HomeAssistant, mac_upper: str) -> bo
 
 
 class LancomBLEScannerManager:
+    __slots__ = (
+        "hass",
+        "config_entry",
+        "_scanners",
+        "_cancel_callbacks",
+        "_scanner_listeners",
+        "_device_id_to_mac",
+        "_services",
+        "_unloaded",
+    )
+
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry):
         self.hass = hass
         self.config_entry = config_entry
         self._scanners: dict[str, LancomBLERemoteScanner] = {}
         self._cancel_callbacks: dict[str, Callable[[], None]] = {}
         # Listener, die informiert werden, wenn ein neuer Scanner entsteht
-        self._scanner_listeners: list[
-            Callable[[LancomBLERemoteScanner], None]
-        ] = []
+        # (Tuple: unveränderlich, daher ohne Kopie sicher iterierbar)
+        self._scanner_listeners: tuple[
+            Callable[[LancomBLERemoteScanner], None], ...
+        ] = ()
+        # Index device_id -> MAC_UPPER unserer AP-Devices (schneller Filter für Registry-Events)
+        self._device_id_to_mac: dict[str, str] = {}
+        # Von async_setup_entry registrierte Service-Namen
+        self._services: tuple[str, ...] = ()
+        # Nach unload() keine Scanner mehr anlegen (verzögerte Webhook-Injection)
+        self._unloaded = False
+        # Index mit bereits registrierten AP-Devices vorbelegen, damit Umbenennungen
+        # auch vor dem ersten Webhook (noch ohne Scanner) erkannt werden
+        for device in dr.async_entries_for_config_entry(
+            dr.async_get(hass), config_entry.entry_id
+        ):
+            self._mac_for_device(device)
 
     def ensure_initial_scanners(self, mac_list: list[str]):
         for mac in mac_list:
@@ -298,7 +379,7 @@ class LancomBLEScannerManager:
             self._cancel_callbacks[mac_upper] = cancel
             _LOGGER.info("Scanner registriert (source=%s).", mac_upper)
             # Listener über neuen Scanner informieren
-            for cb in list(self._scanner_listeners):
+            for cb in self._scanner_listeners:
                 try:
                     cb(scanner)
                 except Exception as e:
@@ -315,6 +396,9 @@ class LancomBLEScannerManager:
         return self._scanners[mac_upper]
 
     def inject_ble(self, payload: dict[str, Any]):
+        if self._unloaded:
+            # Webhook-Payload wurde vor dem Entladen eingeplant -> verwerfen
+            return
         ap_mac = payload.get("deviceMac")
         if not ap_mac:
             _LOGGER.debug(
@@ -338,6 +422,7 @@ class LancomBLEScannerManager:
         _LOGGER.info("Scanner entfernt: %s", mac_upper)
 
     def unload(self):
+        self._unloaded = True
         for mac, cancel in list(self._cancel_callbacks.items()):
             try:
                 cancel()
@@ -348,7 +433,7 @@ class LancomBLEScannerManager:
             _LOGGER.debug("Scanner entladen: %s", mac)
         self._cancel_callbacks.clear()
         self._scanners.clear()
-        self._scanner_listeners.clear()
+        self._scanner_listeners = ()
 
     @property
     def scanners(self) -> dict[str, "LancomBLERemoteScanner"]:
@@ -359,7 +444,7 @@ class LancomBLEScannerManager:
         self, callback: Callable[["LancomBLERemoteScanner"], None]
     ) -> None:
         """Registriere einen Callback, der bei neuen Scannern aufgerufen wird."""
-        self._scanner_listeners.append(callback)
+        self._scanner_listeners = (*self._scanner_listeners, callback)
 
     def _register_or_update_device(self, mac_upper: str):
         devreg = dr.async_get(self.hass)
@@ -367,25 +452,21 @@ class LancomBLEScannerManager:
         existing = devreg.async_get_device(identifiers={(DOMAIN, ident)})
         desired = mac_connection_only(mac_upper)
         if existing:
-            changed = False
+            # Änderungen sammeln und in EINEM Update schreiben (ein Registry-Event statt zwei)
+            changes: dict[str, Any] = {}
             if (
                 self.config_entry.entry_id
                 not in existing.config_entries
             ):
-                devreg.async_update_device(
-                    existing.id,
-                    add_config_entry_id=self.config_entry.entry_id,
-                )
-                changed = True
+                changes["add_config_entry_id"] = self.config_entry.entry_id
             if existing.connections != desired:
-                devreg.async_update_device(
-                    existing.id, new_connections=desired
-                )
-                changed = True
-            if changed:
+                changes["new_connections"] = desired
+            if changes:
+                devreg.async_update_device(existing.id, **changes)
                 _LOGGER.debug("Device aktualisiert: %s", mac_upper)
+            self._device_id_to_mac[existing.id] = mac_upper
             return
-        devreg.async_get_or_create(
+        device = devreg.async_get_or_create(
             config_entry_id=self.config_entry.entry_id,
             identifiers={(DOMAIN, ident)},
             name=f"Lancom AP {mac_upper}",  # Default mit MAC
@@ -394,45 +475,47 @@ class LancomBLEScannerManager:
             sw_version="1.0",
             connections=desired,
         )
+        self._device_id_to_mac[device.id] = mac_upper
         _LOGGER.debug("Device neu erstellt: %s", mac_upper)
 
+    def _mac_for_device(self, device: dr.DeviceEntry) -> str | None:
+        """MAC_UPPER eines unserer Devices (Index zuerst, sonst aus dem Identifier)."""
+        mac_upper = self._device_id_to_mac.get(device.id)
+        if mac_upper is not None:
+            return mac_upper
+        for id_domain, id_value in device.identifiers:
+            if id_domain != DOMAIN:
+                continue
+            mac_upper = _mac_from_identifier(id_value)
+            if mac_upper is not None:
+                self._device_id_to_mac[device.id] = mac_upper
+                return mac_upper
+        return None
+
     def sync_existing_devices(self) -> int:
         devreg = dr.async_get(self.hass)
         count = 0
-        for device in devreg.devices.values():
-            for ident in device.identifiers:
-                if not isinstance(ident, tuple) or len(ident) < 2:
-                    continue
-                id_domain, id_value = ident[0], ident[1]
-                if (
-                    id_domain == DOMAIN
-                    and isinstance(id_value, str)
-                    and id_value.startswith("lancom_ble_")
-                ):
-                    parts = (
-                        id_value.replace("lancom_ble_", "").split("_")
-                    )
-                    if len(parts) == 6:
-                        mac_upper = ":".join(p.upper() for p in parts)
-                        # Stelle Defaultnamen sicher, nur wenn kein user name gesetzt
-                        if not device.name_by_user:
-                            ensure_device_registry_default_name(
-                                self.hass, mac_upper
-                            )
-                        count += 1
-                    break
+        for device in dr.async_entries_for_config_entry(
+            devreg, self.config_entry.entry_id
+        ):
+            mac_upper = self._mac_for_device(device)
+            if mac_upper is None:
+                continue
+            # Stelle Defaultnamen sicher, nur wenn kein user name gesetzt
+            if not device.name_by_user:
+                ensure_device_registry_default_name(
+                    self.hass, mac_upper, devreg
+                )
+            count += 1
         return count
 
     def consolidate_devices(self) -> int:
         devreg = dr.async_get(self.hass)
         grouped: dict[str, list[dr.DeviceEntry]] = {}
-        for device in devreg.devices.values():
-            if not any(
-                isinstance(ident, tuple)
-                and len(ident) >= 2
-                and ident[0] == DOMAIN
-                for ident in device.identifiers
-            ):
+        for device in dr.async_entries_for_config_entry(
+            devreg, self.config_entry.entry_id
+        ):
+            if not any(ident[0] == DOMAIN for ident in device.identifiers):
                 continue
             mac_conns = [
                 c
@@ -449,20 +532,11 @@ class LancomBLEScannerManager:
         for mac_upper, devices in grouped.items():
             if len(devices) <= 1:
                 continue
-            primary = None
-            ident_expected = identifier_for(mac_upper)
-            for dev in devices:
-                if any(
-                    isinstance(ident, tuple)
-                    and len(ident) >= 2
-                    and ident[0] == DOMAIN
-                    and ident[1] == ident_expected
-                    for ident in dev.identifiers
-                ):
-                    primary = dev
-                    break
-            if primary is None:
-                primary = devices[0]
+            key = (DOMAIN, identifier_for(mac_upper))
+            primary = next(
+                (dev for dev in devices if key in dev.identifiers),
+                devices[0],
+            )
             desired = mac_connection_only(mac_upper)
             if primary.connections != desired:
                 devreg.async_update_device(
@@ -521,49 +595,36 @@ class LancomBLEScannerManager:
         - Danach Self-Advert neu injizieren.
         - Zusätzlich: Wenn wir device.name angepasst haben, Scanner neu registrieren, damit der Monitor den neuen Titel übernimmt.
         """
-        if event.data.get("action") != "update":
-            return
+        action = event.data.get("action")
         device_id = event.data.get("device_id")
         if not device_id:
             return
-        devreg = dr.async_get(self.hass)
-        device = devreg.async_get(device_id)
-        if not device:
+        if action == "remove":
+            self._device_id_to_mac.pop(device_id, None)
             return
-        for ident in device.identifiers:
-            if not (
-                isinstance(ident, tuple)
-                and len(ident) >= 2
-                and ident[0] == DOMAIN
-            ):
-                continue
-            value = ident[1]
-            if not value.startswith("lancom_ble_"):
-                continue
-            parts = value.replace("lancom_ble_", "").split("_")
-            if len(parts) != 6:
-                continue
-            mac_upper = ":".join(p.upper() for p in parts)
-            # device.name an Benutzername angleichen (falls sinnvoll)
-            updated = maybe_align_device_name_with_user(
-                self.hass, mac_upper
+        if action != "update":
+            return
+        # Fremde Devices sofort verwerfen (ein Dict-Lookup statt Identifier-Parsing)
+        mac_upper = self._device_id_to_mac.get(device_id)
+        if mac_upper is None:
+            return
+        # device.name an Benutzername angleichen (falls sinnvoll)
+        updated = maybe_align_device_name_with_user(self.hass, mac_upper)
+        # Scanner aktualisieren
+        scanner = self._scanners.get(mac_upper)
+        if updated:
+            _LOGGER.debug(
+                "Gerätename angeglichen → Scanner wird neu registriert: %s",
+                mac_upper,
             )
-            # Scanner aktualisieren
-            scanner = self._scanners.get(mac_upper)
-            if updated:
+            scanner = self._re_register_scanner(mac_upper)
+        else:
+            if scanner:
                 _LOGGER.debug(
-                    "Gerätename angeglichen → Scanner wird neu registriert: %s",
+                    "Gerätename geändert → Reinject Self Advert für %s",
                     mac_upper,
                 )
-                scanner = self._re_register_scanner(mac_upper)
-            else:
-                if scanner:
-                    _LOGGER.debug(
-                        "Gerätename geändert → Reinject Self Advert für %s",
-                        mac_upper,
-                    )
-                    scanner.reinject_name()
-            break
+                scanner.reinject_name()
 
     def fix_all_names(self) -> int:
         """
@@ -572,52 +633,58 @@ class LancomBLEScannerManager:
         """
         devreg = dr.async_get(self.hass)
         changed = 0
-        for device in devreg.devices.values():
-            for ident in device.identifiers:
-                if (
-                    isinstance(ident, tuple)
-                    and len(ident) >= 2
-                    and ident[0] == DOMAIN
-                ):
-                    val = ident[1]
-                    if not val.startswith("lancom_ble_"):
-                        continue
-                    parts = val.replace("lancom_ble_", "").split("_")
-                    if len(parts) != 6:
-                        continue
-                    mac_upper = ":".join(p.upper() for p in parts)
-                    if device.name_by_user:
-                        cleaned = _cleanup_user_name(
-                            device.name_by_user, mac_upper
-                        )
-                        if cleaned != device.name_by_user:
-                            try:
-                                devreg.async_update_device(
-                                    device.id, name_by_user=cleaned
-                                )
-                                changed += 1
-                            except Exception:
-                                pass
+        for device in dr.async_entries_for_config_entry(
+            devreg, self.config_entry.entry_id
+        ):
+            if not device.name_by_user:
+                continue
+            mac_upper = self._mac_for_device(device)
+            if mac_upper is None:
+                continue
+            cleaned = _cleanup_user_name(device.name_by_user, mac_upper)
+            if cleaned != device.name_by_user:
+                try:
+                    devreg.async_update_device(
+                        device.id, name_by_user=cleaned
+                    )
+                    changed += 1
+                except Exception:
+                    pass
         return changed
 
 
 # -------------------- Remote Scanner -------------------- #
 
+# Rolling-Fenster der Paket-Statistik: ein Zähler pro Sekunde über eine Stunde
+PACKET_WINDOW_SECONDS = 3600
+# Mindestabstand für unveränderte Self-Adverts (Webhook ruft inject_self_advert pro Paket)
+SELF_ADVERT_MIN_INTERVAL = 30.0
+# Datum spätestens nach dieser Zeit erneut prüfen (Wanduhr kann springen: NTP, Suspend, Zeitzone)
+DATE_RECHECK_MAX_SECONDS = 300.0
+
 
 class LancomBLERemoteScanner(BaseHaRemoteScanner):
     __slots__ = (
         "hass",
         "mac_upper",
+        "identifier",
+        "device_info",
         "_mac_lower",
         "_discovered_devices",
         "_lancom_timestamps",
         "_last_detection_monotonic",
         "_self_injected",
+        "_last_self_base_name",
+        "_last_self_advert_monotonic",
         "_delayed_task_cancel",
         "_friendly_base_name",
-        "_packet_times",
+        "_packet_buckets",
+        "_bucket_head",
+        "_packets_last_minute",
+        "_packets_last_hour",
         "_packets_today",
         "_today_date",
+        "_next_rollover_monotonic",
     )
 
     def __init__(self, hass: HomeAssistant, ble_mac_upper: str):
@@ -629,6 +696,10 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
         )
         self.hass = hass
         self.mac_upper = ble_mac_upper
+        # Device-Registry-Identifier einmal pro AP (Sensoren nutzen ihn direkt)
+        self.identifier = identifier_for(ble_mac_upper)
+        # Gemeinsame DeviceInfo für alle Paket-Sensoren dieses AP
+        self.device_info = DeviceInfo(identifiers={(DOMAIN, self.identifier)})
         self._mac_lower = ble_mac_upper.lower()
         # dict[MAC_UPPER] -> (BLEDevice, BluetoothAdvertisementData)
         self._discovered_devices: dict[
@@ -637,10 +708,16 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
         self._lancom_timestamps: Dict[str, float] = {}
         self._last_detection_monotonic: float = 0.0
         self._self_injected = False
+        self._last_self_base_name: str | None = None
+        self._last_self_advert_monotonic: float = 0.0
         self._delayed_task_cancel: Callable[[], None] | None = None
         self._friendly_base_name = "Lancom AP"
         # Paket-Statistik (pro AP)
-        self._packet_times: deque[float] = deque()
+        # Ringpuffer: Slot (sekunde % PACKET_WINDOW_SECONDS) zählt Pakete dieser Sekunde
+        self._packet_buckets: list[int] = [0] * PACKET_WINDOW_SECONDS
+        self._bucket_head: int = int(MONOTONIC_TIME())
+        self._packets_last_minute: int = 0
+        self._packets_last_hour: int = 0
         self._packets_today: int = 0
         self._today_date: str = (
             datetime.now(timezone.utc)
@@ -648,6 +725,11 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
             .date()
             .isoformat()
         )
+        # Datum nur prüfen, wenn die nächste Mitternacht erreicht sein kann
+        # (gedeckelt, damit Sprünge der Wanduhr spätestens nach einigen Minuten auffallen)
+        self._next_rollover_monotonic: float = MONOTONIC_TIME() + min(
+            seconds_until_midnight_local(), DATE_RECHECK_MAX_SECONDS
+        )
 
     @property
     def address(self) -> str:
@@ -662,6 +744,18 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
         """Anzahl der heute empfangenen Datenpakete für diesen AP."""
         return self._packets_today
 
+    @property
+    def packets_last_minute(self) -> int:
+        """Anzahl der Datenpakete in den letzten 60 Sekunden."""
+        self._advance_buckets(int(MONOTONIC_TIME()))
+        return self._packets_last_minute
+
+    @property
+    def packets_last_hour(self) -> int:
+        """Anzahl der Datenpakete in der letzten Stunde."""
+        self._advance_buckets(int(MONOTONIC_TIME()))
+        return self._packets_last_hour
+
     @property
     def discovered_devices(self):
         return [pair[0] for pair in self._discovered_devices.values()]
@@ -680,15 +774,20 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
             return 9999.0
         return max(0.0, now - self._last_detection_monotonic)
 
-    def _touch_detection(self):
-        self._last_detection_monotonic = MONOTONIC_TIME()
+    def _touch_detection(self, now_mono: float):
+        self._last_detection_monotonic = now_mono
 
-    def _set_stamp(self, mac_upper: str):
-        self._lancom_timestamps[mac_upper] = MONOTONIC_TIME()
-        self._touch_detection()
+    def _set_stamp(self, mac_upper: str, now_mono: float):
+        self._lancom_timestamps[mac_upper] = now_mono
+        self._touch_detection(now_mono)
 
-    def _roll_today_if_needed(self) -> None:
+    def _roll_today_if_needed(self, now_mono: float) -> None:
         """Setzt den 'heute'-Zähler zurück, wenn sich das Datum geändert hat."""
+        if now_mono < self._next_rollover_monotonic:
+            return
+        self._next_rollover_monotonic = now_mono + min(
+            seconds_until_midnight_local(), DATE_RECHECK_MAX_SECONDS
+        )
         now_local = datetime.now(timezone.utc).astimezone()
         today = now_local.date().isoformat()
         if today != self._today_date:
@@ -702,21 +801,57 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
             self._today_date = today
             self._packets_today = 0
 
-    def _record_packet(self) -> None:
+    def _advance_buckets(self, now_sec: int) -> None:
         """
-        Registriert ein neu eingetroffenes Datenpaket für diesen AP.
-        Hält eine Zeitliste für Rolling-Statistiken und zählt 'heute'.
+        Schiebt den Ringpuffer bis now_sec vor: abgelaufene Sekunden werden genullt
+        und aus den laufenden Summen (Minute/Stunde) herausgerechnet.
         """
-        self._roll_today_if_needed()
+        head = self._bucket_head
+        if now_sec <= head:
+            return
+        self._bucket_head = now_sec
+        buckets = self._packet_buckets
+        size = PACKET_WINDOW_SECONDS
+        if now_sec - head >= size:
+            # Länger als das ganze Fenster keine Pakete: alles zurücksetzen
+            buckets[:] = [0] * size
+            self._packets_last_minute = 0
+            self._packets_last_hour = 0
+            return
+        # Slots der Sekunden head+1..now_sec enthalten noch Werte von vor einer Stunde:
+        # per Slice (C-Ebene) aus der Stundensumme nehmen und nullen
+        steps = now_sec - head
+        start = (head + 1) % size
+        end = start + steps
+        if end <= size:
+            self._packets_last_hour -= sum(buckets[start:end])
+            buckets[start:end] = [0] * steps
+        else:
+            end -= size
+            self._packets_last_hour -= sum(buckets[start:]) + sum(buckets[:end])
+            buckets[start:] = [0] * (size - start)
+            buckets[:end] = [0] * end
+        # Minutenfenster = die letzten 60 Slots bis einschließlich now_sec
+        lo = (now_sec - 59) % size
+        hi = now_sec % size + 1
+        if lo < hi:
+            self._packets_last_minute = sum(buckets[lo:hi])
+        else:
+            self._packets_last_minute = sum(buckets[lo:]) + sum(buckets[:hi])
 
-        now_mono = MONOTONIC_TIME()
-        self._packet_times.append(now_mono)
-        self._packets_today += 1
+    def _record_packet(self, now_mono: float, count: int = 1) -> None:
+        """
+        Registriert count neu eingetroffene Datenpakete für diesen AP.
+        Zählt im Sekunden-Ringpuffer (O(1), feste Größe) und 'heute'.
+        """
+        self._roll_today_if_needed(now_mono)
 
-        # Rolling-Window: alte Einträge (>24h) entfernen
-        cutoff_24h = now_mono - 24 * 3600
-        while self._packet_times and self._packet_times[0] < cutoff_24h:
-            self._packet_times.popleft()
+        now_sec = int(now_mono)
+        self._advance_buckets(now_sec)
+        self._packet_buckets[now_sec % PACKET_WINDOW_SECONDS] += count
+        self._packets_last_minute += count
+        self._packets_last_hour += count
+        self._packets_today += count
 
     def _inject(
         self,
@@ -724,19 +859,34 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
         local_name: str,
         rssi: int,
         details: dict[str, Any],
+        now_mono: float | None = None,
     ):
-        """Hilfsfunktion: Füllt interne Strukturen und ruft _async_on_advertisement auf."""
-        self._set_stamp(mac_upper)
-        bledev = BLEDevice(address=mac_upper, name=local_name, rssi=rssi)
-        adv = BluetoothAdvertisementData(
-            local_name=local_name,
-            service_uuids=[],
-            manufacturer_data={},
-            service_data={},
-            rssi=rssi,
-            tx_power=None,
-        )
-        self._discovered_devices[mac_upper] = (bledev, adv)
+        """
+        Hilfsfunktion: Füllt interne Strukturen und ruft _async_on_advertisement auf.
+        now_mono: bereits gelesene Monotonic-Zeit (eine Uhrabfrage pro Advert).
+        """
+        if now_mono is None:
+            now_mono = MONOTONIC_TIME()
+        self._set_stamp(mac_upper, now_mono)
+        # Unverändertes Advert-Paar (Name + RSSI) wiederverwenden statt neu allozieren
+        pair = self._discovered_devices.get(mac_upper)
+        if (
+            pair is None
+            or pair[1].rssi != rssi
+            or pair[1].local_name != local_name
+        ):
+            bledev = BLEDevice(address=mac_upper, name=local_name, rssi=rssi)
+            adv = BluetoothAdvertisementData(
+                local_name=local_name,
+                service_uuids=[],
+                manufacturer_data={},
+                service_data={},
+                rssi=rssi,
+                tx_power=None,
+            )
+            self._discovered_devices[mac_upper] = (bledev, adv)
+        else:
+            adv = pair[1]
         try:
             self._async_on_advertisement(
                 address=mac_upper,
@@ -747,15 +897,17 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
                 manufacturer_data=adv.manufacturer_data,
                 tx_power=adv.tx_power,
                 details=details,
-                advertisement_monotonic_time=MONOTONIC_TIME(),
-            )
-            _LOGGER.debug(
-                "Injected advert: name='%s' mac='%s' rssi=%s details=%s",
-                local_name,
-                mac_upper,
-                rssi,
-                details,
+                advertisement_monotonic_time=now_mono,
             )
+            # Hot-Path: Argument-Tupel nur bauen, wenn DEBUG aktiv ist
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Injected advert: name='%s' mac='%s' rssi=%s details=%s",
+                    local_name,
+                    mac_upper,
+                    rssi,
+                    details,
+                )
         except Exception as e:
             _LOGGER.error(
                 "Advert injection fehlgeschlagen für %s: %s", mac_upper, e
@@ -769,11 +921,25 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
     def inject_self_advert(self):
         """
         Sende (oder erneuere) den Self-Advert sofort.
+        Unveränderte Self-Adverts innerhalb von SELF_ADVERT_MIN_INTERVAL werden übersprungen.
         """
         base = self._compute_base_name()
+        now_mono = MONOTONIC_TIME()
+        if (
+            self._self_injected
+            and base == self._last_self_base_name
+            and now_mono - self._last_self_advert_monotonic
+            < SELF_ADVERT_MIN_INTERVAL
+        ):
+            self._touch_detection(now_mono)
+            return
         ensure_device_registry_default_name(self.hass, self.mac_upper)
-        self._inject(self.mac_upper, base, -55, {"lancom_self": True})
+        self._inject(
+            self.mac_upper, base, -55, {"lancom_self": True}, now_mono
+        )
         self._self_injected = True
+        self._last_self_base_name = base
+        self._last_self_advert_monotonic = now_mono
         _LOGGER.debug(
             "Self Advert (immediate) gesendet: base='%s', mac='%s'",
             base,
@@ -789,6 +955,8 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
         self._inject(
             self.mac_upper, base, -54, {"lancom_self_rename": True}
         )
+        self._last_self_base_name = base
+        self._last_self_advert_monotonic = MONOTONIC_TIME()
         _LOGGER.debug(
             "Self Advert (rename) gesendet: base='%s', mac='%s'",
             base,
@@ -828,29 +996,55 @@ class LancomBLERemoteScanner(BaseHaRemoteScanner):
     def inject_ble(self, data: dict[str, Any]):
         """Webhook: injiziere fremde Advertisements."""
         measurements = data.get("measurements", [])
+        # Pro Webhook nur ein Advert je Geräte-MAC: stärkstes RSSI gewinnt,
+        # der Name wird separat gemerkt (nicht jedes Advert enthält einen local_name)
+        batch: dict[str, tuple[str | None, int]] = {}
+        packets = 0
         for m in measurements:
             raw = m.get("deviceAddress")
             if not raw:
                 continue
             dev_mac_upper = format_ble_mac(raw)
-            rssi_val = _safe_int(m.get("rssi"), default=-70)
+            rssi_val = m.get("rssi")
+            # JSON liefert RSSI typischerweise als int -> ohne Funktionsaufruf übernehmen
+            if type(rssi_val) is not int:
+                rssi_val = _safe_int(rssi_val, default=-70)
             if rssi_val == -127:
                 rssi_val = -70
-            name = m.get("name") or dev_mac_upper
+            name = m.get("name") or None
             adv_hex = m.get("advertisingData", "")
-            if isinstance(adv_hex, str) and adv_hex:
-                try:
-                    _ = unhexlify(adv_hex)
-                except Exception:
-                    _LOGGER.debug(
-                        "Ungültiges advertisingData (%s) für %s",
-                        adv_hex,
-                        dev_mac_upper,
-                    )
+            # Nur validieren (kein bytes-Objekt pro Paket erzeugen)
+            if (
+                isinstance(adv_hex, str)
+                and adv_hex
+                and (len(adv_hex) & 1 or not _HEX_RE.match(adv_hex))
+            ):
+                _LOGGER.debug(
+                    "Ungültiges advertisingData (%s) für %s",
+                    adv_hex,
+                    dev_mac_upper,
+                )
             # Jedes Measurement zählt als ein Datenpaket für diesen AP
-            self._record_packet()
+            packets += 1
+            prev = batch.get(dev_mac_upper)
+            if prev is None:
+                batch[dev_mac_upper] = (name, rssi_val)
+            else:
+                batch[dev_mac_upper] = (
+                    name or prev[0],
+                    rssi_val if rssi_val > prev[1] else prev[1],
+                )
+        if not packets:
+            return
+        now_mono = MONOTONIC_TIME()
+        self._record_packet(now_mono, packets)
+        for dev_mac_upper, (name, rssi_val) in batch.items():
             self._inject(
-                dev_mac_upper, name, rssi_val, {"lancom": True}
+                dev_mac_upper,
+                name or dev_mac_upper,
+                rssi_val,
+                {"lancom": True},
+                now_mono,
             )
 
 
@@ -882,30 +1076,42 @@ async def async_setup_entry(
     )
 
     if ap_list:
-        _LOGGER.info(
-            "Initiale AP-Liste (%d): %s",
-            len(ap_list),
-            ", ".join(ap_list),
-        )
+        # join nur bauen, wenn INFO tatsächlich ausgegeben wird
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Initiale AP-Liste (%d): %s",
+                len(ap_list),
+                ", ".join(ap_list),
+            )
         manager.ensure_initial_scanners(ap_list)
     else:
         _LOGGER.info(
             "Keine initiale AP-Liste: Scanner entstehen beim ersten Webhook."
         )
 
+    @callback
+    def _inject_payload(payload: dict[str, Any]) -> None:
+        """Verarbeitet den Webhook-Payload nach der Antwort (Fehler wie bisher loggen)."""
+        try:
+            manager.inject_ble(payload)
+        except Exception as e:
+            _LOGGER.error("Webhook Fehler: %s", e)
+
     @callback
     async def lancom_ble_webhook_handler(
         _hass_cb, _webhook_id_cb, request
     ):
         try:
-            payload = await request.json()
+            # orjson-basierter Parser von HA statt stdlib json
+            payload = await request.json(loads=json_loads)
             if not isinstance(payload, dict):
                 _LOGGER.error(
                     "Webhook erwartet JSON-Objekt, erhalten: %s",
                     type(payload),
                 )
                 return Response(status=200)
-            manager.inject_ble(payload)
+            # Erst antworten, dann verarbeiten: Injection läuft im nächsten Loop-Durchlauf
+            hass.loop.call_soon(_inject_payload, payload)
             return Response(status=200)
         except Exception as e:
             _LOGGER.error("Webhook Fehler: %s", e)
@@ -931,7 +1137,7 @@ async def async_setup_entry(
             _LOGGER.error("Service add_ap ohne mac.")
             return
         fm = format_ble_mac(mac)
-        if fm.count(":") != 5:
+        if not _MAC_CANONICAL_RE.match(fm):
             _LOGGER.error(
                 "Ungültige MAC beim add_ap: %s (normalisiert=%s)",
                 mac,
@@ -969,27 +1175,17 @@ async def async_setup_entry(
             changed,
         )
 
-    hass.services.async_register(
-        DOMAIN, "add_ap", handle_add_ap, schema=None
-    )
-    hass.services.async_register(
-        DOMAIN, "sync_registry", handle_sync_registry, schema=None
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "consolidate_devices",
-        handle_consolidate_devices,
-        schema=None,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "force_scanner_name",
-        handle_force_scanner_name,
-        schema=None,
-    )
-    hass.services.async_register(
-        DOMAIN, "fix_all_names", handle_fix_all_names, schema=None
-    )
+    services: dict[str, Callable[[ServiceCall], Any]] = {
+        "add_ap": handle_add_ap,
+        "sync_registry": handle_sync_registry,
+        "consolidate_devices": handle_consolidate_devices,
+        "force_scanner_name": handle_force_scanner_name,
+        "fix_all_names": handle_fix_all_names,
+    }
+    for srv, handler in services.items():
+        hass.services.async_register(DOMAIN, srv, handler, schema=None)
+    # Registrierte Services merken (für async_unload_entry)
+    manager._services = tuple(services)
 
     _LOGGER.info(
         "Lancom BLE aktiv – Webhook: /api/webhook/%s", webhook_id
@@ -1004,23 +1200,16 @@ async def async_unload_entry(
     if not store:
         return True
     async_unregister_webhook(hass, store["webhook_id"])
+    services: tuple[str, ...] = ()
     if "scanner_manager" in store:
+        services = store["scanner_manager"]._services
         store["scanner_manager"].unload()
     # Sensor-Plattform entladen
     await hass.config_entries.async_unload_platforms(entry, ["sensor"])
     hass.data[DOMAIN].pop(entry.entry_id, None)
     if not hass.data.get(DOMAIN):
-        for srv in (
-            "add_ap",
-            "sync_registry",
-            "consolidate_devices",
-            "force_scanner_name",
-            "fix_all_names",
-        ):
-            try:
-                hass.services.async_remove(DOMAIN, srv)
-            except Exception:
-                pass
+        for srv in services:
+            hass.services.async_remove(DOMAIN, srv)
     _LOGGER.info("Lancom BLE entladen (entry_id=%s).", entry.entry_id)
     return True
 
@@ -1029,13 +1218,12 @@ async def async_remove_entry(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
     devreg = dr.async_get(hass)
-    devices = list(
-        dr.async_entries_for_config_entry(devreg, entry.entry_id)
-    )
+    only_ours = {entry.entry_id}
     removed = 0
     detached = 0
-    for device in devices:
-        if device.config_entries == {entry.entry_id}:
+    # async_entries_for_config_entry liefert bereits eine eigene Liste (sicher beim Löschen)
+    for device in dr.async_entries_for_config_entry(devreg, entry.entry_id):
+        if device.config_entries == only_ours:
             devreg.async_remove_device(device.id)
             removed += 1
         else:
@@ -1064,13 +1252,8 @@ async def async_remove_config_entry_device(
             device_entry.id,
         )
         return True
-    our_idents = {
-        ident
-        for ident in device_entry.identifiers
-        if isinstance(ident, tuple)
-        and len(ident) >= 2
-        and ident[0] == DOMAIN
-    }
+    # Identifier sind in HA immer (domain, id)-Tupel
+    our_idents = {i for i in device_entry.identifiers if i[0] == DOMAIN}
     if our_idents:
         new_identifiers = set(device_entry.identifiers) - our_idents
         devreg.async_update_device(
@@ -2,21 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable
 import logging
 
 from homeassistant.components.sensor import (
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.components.bluetooth import MONOTONIC_TIME
 
 from .const import DOMAIN
-from . import LancomBLEScannerManager, LancomBLERemoteScanner, identifier_for
+from . import LancomBLEScannerManager, LancomBLERemoteScanner
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,6 +74,53 @@ async def async_setup_entry(
     manager.register_scanner_listener(_handle_new_scanner)
 
 
+@dataclass(frozen=True, kw_only=True)
+class LancomBLEPacketSensorEntityDescription(SensorEntityDescription):
+    """Beschreibung eines Paket-Sensors (Wert-Funktion + Scope-Attribut)."""
+
+    value_fn: Callable[[LancomBLERemoteScanner], int | float]
+    scope: str
+
+
+# Paket-Sensoren pro AP (key wird Teil der unique_id)
+PACKET_SENSORS: tuple[LancomBLEPacketSensorEntityDescription, ...] = (
+    LancomBLEPacketSensorEntityDescription(
+        key="packets_today",
+        name="Pakete heute",
+        # Totalzähler, der innerhalb eines Tages nur steigt
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement="packets",
+        scope="today",
+        value_fn=attrgetter("packets_today"),
+    ),
+    LancomBLEPacketSensorEntityDescription(
+        key="packets_last_minute",
+        name="Pakete letzte Minute",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="packets",
+        scope="last_minute",
+        value_fn=attrgetter("packets_last_minute"),
+    ),
+    LancomBLEPacketSensorEntityDescription(
+        key="packets_last_hour",
+        name="Pakete letzte Stunde",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="packets",
+        scope="last_hour",
+        value_fn=attrgetter("packets_last_hour"),
+    ),
+    LancomBLEPacketSensorEntityDescription(
+        key="packets_per_minute",
+        name="Pakete pro Minute",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="packets/minute",
+        scope="rate_per_minute",
+        # Da das Fenster genau 60s ist, entspricht die Rate der Anzahl.
+        value_fn=lambda scanner: float(scanner.packets_last_minute),
+    ),
+)
+
+
 def create_sensors_for_scanner(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -80,195 +128,46 @@ def create_sensors_for_scanner(
 ) -> list[SensorEntity]:
     """Erzeuge alle Paket-Sensoren für einen Scanner/AP."""
     return [
-        LancomBLEPacketsTodaySensor(hass, entry, scanner),
-        LancomBLEPacketsLastMinuteSensor(hass, entry, scanner),
-        LancomBLEPacketsLastHourSensor(hass, entry, scanner),
-        LancomBLEPacketsPerMinuteSensor(hass, entry, scanner),
+        LancomBLEPacketSensor(hass, entry, scanner, description)
+        for description in PACKET_SENSORS
     ]
 
 
-class _BaseLancomBLEPacketSensor(SensorEntity):
-    """Basisklasse für Paket-Sensoren (stellt Device-Verknüpfung bereit)."""
+class LancomBLEPacketSensor(SensorEntity):
+    """Paket-Sensor eines AP; Kennzahl und Metadaten kommen aus der EntityDescription."""
+
+    # SensorEntity hat selbst keine Slots (__dict__ bleibt), aber unsere Attribute liegen in Slots
+    __slots__ = ("_hass", "_entry", "_scanner")
+
+    entity_description: LancomBLEPacketSensorEntityDescription
 
     _attr_has_entity_name = True
-    _attr_native_unit_of_measurement = "packets"
-    # device_class lassen wir leer (nur "Anzahl", generisch)
-    _attr_device_class = None
 
     def __init__(
         self,
         hass: HomeAssistant,
         entry: ConfigEntry,
         scanner: LancomBLERemoteScanner,
+        description: LancomBLEPacketSensorEntityDescription,
     ) -> None:
         self._hass = hass
         self._entry = entry
         self._scanner = scanner
+        self.entity_description = description
 
-        mac_upper = scanner.mac_upper
-        ident = identifier_for(mac_upper)
-
-        # DeviceInfo verknüpft den Sensor mit dem bestehenden AP-Device
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, ident)},
+        # DeviceInfo (vom Scanner geteilt) verknüpft den Sensor mit dem bestehenden AP-Device
+        self._attr_device_info = scanner.device_info
+        self._attr_unique_id = (
+            f"{entry.entry_id}_{scanner.identifier}_{description.key}"
         )
 
-
-class LancomBLEPacketsTodaySensor(_BaseLancomBLEPacketSensor):
-    """Sensor: Anzahl Datenpakete, die heute über diesen AP eingetroffen sind."""
-
-    # Totalzähler, der innerhalb eines Tages nur steigt
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        scanner: LancomBLERemoteScanner,
-    ) -> None:
-        super().__init__(hass, entry, scanner)
-
-        mac_upper = scanner.mac_upper
-        ident = identifier_for(mac_upper)
-
-        self._attr_unique_id = f"{entry.entry_id}_{ident}_packets_today"
-        self._attr_name = "Pakete heute"
-
-    @property
-    def native_value(self) -> int:
-        return self._scanner.packets_today
-
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return {
-            "ap_mac": self._scanner.mac_upper,
-            "scope": "today",
-        }
-
-
-class LancomBLEPacketsLastMinuteSensor(_BaseLancomBLEPacketSensor):
-    """Sensor: Anzahl Datenpakete in der letzten Minute für diesen AP."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        scanner: LancomBLERemoteScanner,
-    ) -> None:
-        super().__init__(hass, entry, scanner)
-
-        mac_upper = scanner.mac_upper
-        ident = identifier_for(mac_upper)
-
-        self._attr_unique_id = f"{entry.entry_id}_{ident}_packets_last_minute"
-        self._attr_name = "Pakete letzte Minute"
-
-    @property
-    def native_value(self) -> int:
-        # Berechne auf Basis des internen packet_times-Arrays
-        try:
-            packet_times = getattr(self._scanner, "_packet_times", None)
-        except Exception:
-            packet_times = None
-        if not packet_times:
-            return 0
-
-        now_mono = MONOTONIC_TIME()
-        cutoff_1m = now_mono - 60
-        return sum(1 for t in packet_times if t >= cutoff_1m)
+    def native_value(self) -> int | float:
+        return self.entity_description.value_fn(self._scanner)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         return {
             "ap_mac": self._scanner.mac_upper,
-            "scope": "last_minute",
+            "scope": self.entity_description.scope,
         }
-
-
-class LancomBLEPacketsLastHourSensor(_BaseLancomBLEPacketSensor):
-    """Sensor: Anzahl Datenpakete in der letzten Stunde für diesen AP."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        scanner: LancomBLERemoteScanner,
-    ) -> None:
-        super().__init__(hass, entry, scanner)
-
-        mac_upper = scanner.mac_upper
-        ident = identifier_for(mac_upper)
-
-        self._attr_unique_id = f"{entry.entry_id}_{ident}_packets_last_hour"
-        self._attr_name = "Pakete letzte Stunde"
-
-    @property
-    def native_value(self) -> int:
-        try:
-            packet_times = getattr(self._scanner, "_packet_times", None)
-        except Exception:
-            packet_times = None
-        if not packet_times:
-            return 0
-
-        now_mono = MONOTONIC_TIME()
-        cutoff_1h = now_mono - 3600
-        return sum(1 for t in packet_times if t >= cutoff_1h)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return {
-            "ap_mac": self._scanner.mac_upper,
-            "scope": "last_hour",
-        }
-
-
-class LancomBLEPacketsPerMinuteSensor(_BaseLancomBLEPacketSensor):
-    """Sensor: geschätzte Paketrate pro Minute (rolling window, letzte 60s)."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    # Einheit: Pakete pro Minute
-    _attr_native_unit_of_measurement = "packets/minute"
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        scanner: LancomBLERemoteScanner,
-    ) -> None:
-        super().__init__(hass, entry, scanner)
-
-        mac_upper = scanner.mac_upper
-        ident = identifier_for(mac_upper)
-
-        self._attr_unique_id = f"{entry.entry_id}_{ident}_packets_per_minute"
-        self._attr_name = "Pakete pro Minute"
-
-    @property
-    def native_value(self) -> float | int:
-        """Rate auf Basis der letzten 60 Sekunden."""
-        try:
-            packet_times = getattr(self._scanner, "_packet_times", None)
-        except Exception:
-            packet_times = None
-        if not packet_times:
-            return 0.0
-
-        now_mono = MONOTONIC_TIME()
-        cutoff_1m = now_mono - 60
-        count_last_minute = sum(1 for t in packet_times if t >= cutoff_1m)
-
-        # Da das Fenster genau 60s ist, entspricht die Rate der Anzahl.
-        # Optional könnte man hier glätten oder mit kürzerem Fenster rechnen.
-        return float(count_last_minute)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return {
-            "ap_mac": self._scanner.mac_upper,
-            "scope": "rate_per_minute",
-        }
\ No newline at end of file